@@ -1,36 +1,190 @@
+import functools
+import importlib.util
+import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import math
+import os
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
-import json
 
+import numpy as np
+import orjson
 import pandas as pd
-import great_expectations as gx
-from great_expectations.core import ExpectationConfiguration
-from great_expectations.core.batch import RuntimeBatchRequest
-from great_expectations.data_context import DataContext
+
+# Great Expectations is slow to import, so it is imported where it is used
+# rather than when this module is loaded
+if TYPE_CHECKING:
+    from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+    from great_expectations.data_context import AbstractDataContext
 
 logger = logging.getLogger(__name__)
 
+# Below this many rows per column, thread pool startup costs more than the
+# statistics themselves, so columns are processed serially
+_PARALLEL_MIN_ROWS = 100_000
+
+# Integers at or above this magnitude are not all exactly representable as
+# float64, so min/max for such columns are taken from pandas instead
+_MAX_EXACT_FLOAT_INT = 2**53
+
+# dtype.kind codes of columns validate_statistical_properties can summarize
+_NUMERIC_KINDS = frozenset("biuf")
+
+# numpy dtype.kind codes accepted for each expected dtype family; "string" is
+# checked separately since every pandas extension dtype reports kind "O"
+_DTYPE_FAMILY_KINDS = {
+    "int": frozenset("iu"),
+    "float": frozenset("f"),
+    "datetime": frozenset("M"),
+    "bool": frozenset("b"),
+}
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _to_json_builtin(obj: Any) -> Any:
+    """Convert numpy values to Python builtins and NaN to None, recursively."""
+    if isinstance(obj, dict):
+        return {key: _to_json_builtin(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_builtin(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _to_json_builtin(obj.tolist())
+    if isinstance(obj, np.generic):
+        return _to_json_builtin(obj.item())
+    if isinstance(obj, float) and math.isnan(obj):
+        return None
+    return obj
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize obj to JSON indented by two spaces; NaN is written as null."""
+    try:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    except TypeError:
+        # orjson rejects integers outside the 64-bit range; the stdlib encoder
+        # handles them, given the same numpy and NaN conversions as above
+        return json.dumps(_to_json_builtin(obj), indent=2, default=str)
+
+
+def _is_string_dtype(dtype: Any) -> bool:
+    """Check if dtype holds strings (object, str, bytes, string or category)."""
+    if isinstance(dtype, np.dtype):
+        return dtype.kind in "OUS"
+    if isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype)):
+        return True
+    if isinstance(dtype, pd.ArrowDtype):
+        import pyarrow as pa
+
+        arrow_type = dtype.pyarrow_dtype
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+    return False
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """Return series values as a float64 array with missing values as NaN."""
+    if series.dtype == np.float64:
+        # Already NaN-encoded; reuse the underlying buffer without a copy
+        return series.to_numpy(copy=False)
+
+    # Nullable and integer columns need their NA markers mapped to NaN
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _column_stats(values: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """Compute mean, std, min, max and null rate of a float array in one pass.
+
+    Plain Python; use the compiled version returned by _stats_kernel().
+    """
+    n = values.size
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    min_value = np.inf
+    max_value = -np.inf
+
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            continue
+        # Welford's online update for mean and sum of squared deviations
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+        if x < min_value:
+            min_value = x
+        if x > max_value:
+            max_value = x
+
+    null_rate = (n - count) / n if n > 0 else np.nan
+    if count == 0:
+        return np.nan, np.nan, np.nan, np.nan, null_rate
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    return mean, std, min_value, max_value, null_rate
+
+
+@functools.cache
+def _stats_kernel() -> Callable[[np.ndarray], Tuple[float, float, float, float, float]]:
+    """Return _column_stats compiled with Numba, importing Numba on first use."""
+    from numba import njit
+
+    return njit(cache=True, nogil=True)(_column_stats)
+
+
+def _series_stats(series: pd.Series) -> Tuple[Any, Any, Any, Any, float]:
+    """Compute mean, std, min, max and null rate of a numeric series.
+
+    Statistics are computed on float64 values. For integer columns min and max
+    are returned as ints, taken from pandas when they exceed float64's exact
+    integer range; bool columns report min and max as 0.0/1.0.
+    """
+    mean, std, min_value, max_value, null_rate = _stats_kernel()(_float_values(series))
+
+    if series.dtype.kind in "iu" and not np.isnan(min_value):
+        if max(abs(min_value), abs(max_value)) >= _MAX_EXACT_FLOAT_INT:
+            min_value, max_value = series.min(), series.max()
+        else:
+            min_value, max_value = int(min_value), int(max_value)
+
+    return mean, std, min_value, max_value, null_rate
+
 
 class DataValidator:
     """Base class for data validation using Great Expectations."""
 
     def __init__(self, context_root_dir: str = "./data_quality"):
         """Initialize the DataValidator with Great Expectations context."""
-        self.context = gx.get_context(context_root_dir=context_root_dir)
+        import great_expectations as gx
+
+        self.context: "AbstractDataContext" = gx.get_context(context_root_dir=context_root_dir)
         self.validation_results = []
+        self._suite_cache: Dict[str, "ExpectationSuite"] = {}
 
     def validate_schema(
         self,
         df: pd.DataFrame,
-        expected_columns: List[str],
+        expected_columns: Iterable[str],
         expected_dtypes: Dict[str, str]
     ) -> Dict[str, Any]:
         """Validate dataframe schema.
 
         Args:
             df: DataFrame to validate
-            expected_columns: List of expected column names
+            expected_columns: Expected column names (list or frozenset)
             expected_dtypes: Dictionary mapping column names to expected data types
 
         Returns:
@@ -38,47 +192,54 @@ def validate_schema(
         """
         if df is None or df.empty:
             return {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "validation_type": "schema",
                 "passed": False,
                 "errors": [{"type": "empty_dataframe", "message": "DataFrame is None or empty"}]
             }
 
         validation_results = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "validation_type": "schema",
             "passed": True,
             "errors": []
         }
 
-        # Check for missing columns
-        missing_columns = set(expected_columns) - set(df.columns)
+        expected_set = frozenset(expected_columns)
+
+        # Single pass over the columns; the mapping also serves as the set of
+        # actual column names for the membership checks below
+        actual_dtypes = dict(zip(df.columns, df.dtypes))
+
+        # Check for missing columns, reported in the order they were expected
+        missing_columns = [
+            col for col in dict.fromkeys(expected_columns) if col not in actual_dtypes
+        ]
         if missing_columns:
             validation_results["passed"] = False
             validation_results["errors"].append({
                 "type": "missing_columns",
-                "columns": list(missing_columns)
+                "columns": missing_columns
             })
 
         # Check for unexpected columns
-        unexpected_columns = set(df.columns) - set(expected_columns)
+        unexpected_columns = [col for col in actual_dtypes if col not in expected_set]
         if unexpected_columns:
             validation_results["errors"].append({
                 "type": "unexpected_columns",
-                "columns": list(unexpected_columns)
+                "columns": unexpected_columns
             })
 
         # Check data types
         dtype_mismatches = []
         for col, expected_dtype in expected_dtypes.items():
-            if col in df.columns:
-                actual_dtype = str(df[col].dtype)
-                if not self._dtype_compatible(actual_dtype, expected_dtype):
-                    dtype_mismatches.append({
-                        "column": col,
-                        "expected": expected_dtype,
-                        "actual": actual_dtype
-                    })
+            actual_dtype = actual_dtypes.get(col)
+            if actual_dtype is not None and not self._dtype_compatible(actual_dtype, expected_dtype):
+                dtype_mismatches.append({
+                    "column": col,
+                    "expected": expected_dtype,
+                    "actual": str(actual_dtype)
+                })
 
         if dtype_mismatches:
             validation_results["passed"] = False
@@ -94,10 +255,24 @@ def validate_data_quality(
         df: pd.DataFrame,
         expectation_suite_name: str,
         datasource_name: str = "runtime_datasource",
-        data_asset_name: str = "runtime_data"
+        data_asset_name: str = "runtime_data",
+        arrow_strings: bool = False
     ) -> Tuple[bool, Dict[str, Any]]:
-        """Run Great Expectations validation suite on dataframe."""
+        """Run Great Expectations validation suite on dataframe.
+
+        If arrow_strings is set, columns holding only strings are converted to
+        string[pyarrow] before validation. This requires pyarrow; an ImportError
+        is raised rather than reported as a validation failure.
+        """
+        from great_expectations.core.batch import RuntimeBatchRequest
+
+        if arrow_strings and importlib.util.find_spec("pyarrow") is None:
+            raise ImportError("arrow_strings=True requires pyarrow to be installed")
+
         try:
+            if arrow_strings:
+                df = self._to_arrow_strings(df)
+
             # Create runtime batch request
             batch_request = RuntimeBatchRequest(
                 datasource_name=datasource_name,
@@ -107,15 +282,18 @@ def validate_data_quality(
                 batch_identifiers={"default_identifier_name": "default_identifier"}
             )
 
-            # Get expectation suite
-            expectation_suite = self.context.get_expectation_suite(
-                expectation_suite_name=expectation_suite_name
-            )
+            # Get expectation suite, loading it from the context only once
+            expectation_suite = self._suite_cache.get(expectation_suite_name)
+            if expectation_suite is None:
+                expectation_suite = self.context.get_expectation_suite(
+                    expectation_suite_name=expectation_suite_name
+                )
+                self._suite_cache[expectation_suite_name] = expectation_suite
 
             # Create validator
             validator = self.context.get_validator(
                 batch_request=batch_request,
-                expectation_suite_name=expectation_suite_name
+                expectation_suite=expectation_suite
             )
 
             # Run validation
@@ -127,7 +305,7 @@ def validate_data_quality(
             result_summary = {
                 "suite_name": expectation_suite_name,
                 "passed": passed,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "statistics": validation_result["statistics"],
                 "failed_expectations": []
             }
@@ -164,54 +342,92 @@ def validate_statistical_properties(
             Dictionary containing validation results
         """
         validation_results = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "validation_type": "statistical",
             "passed": True,
             "violations": []
         }
 
-        for col in numeric_columns:
-            if col not in df.columns:
-                continue
+        # Split "<stat>_min"/"<stat>_max" threshold keys once up front
+        bounds = {
+            col: {
+                tuple(key.rsplit("_", 1)): value
+                for key, value in col_thresholds.items()
+                if key.endswith(("_min", "_max"))
+            }
+            for col, col_thresholds in thresholds.items()
+        }
+
+        # Only compute statistics for columns that have bounds to check
+        present_columns = [
+            col for col in dict.fromkeys(numeric_columns)
+            if bounds.get(col) and col in df.columns
+        ]
+        if not present_columns:
+            return validation_results
 
+        # Statistics are computed on float64; other dtypes (datetimes, Decimal
+        # objects, ...) would be silently reinterpreted in different units
+        for col in present_columns:
+            dtype = df[col].dtype
+            if dtype.kind not in _NUMERIC_KINDS:
+                raise TypeError(
+                    f"Column '{col}' has non-numeric dtype '{dtype}'; statistical "
+                    "validation supports bool, integer and float columns"
+                )
+
+        # Columns are independent and the kernel releases the GIL, so large
+        # multi-column frames are processed concurrently. Each worker converts
+        # its own column, so only in-flight columns are copied to float64.
+        max_workers = min(len(present_columns), os.cpu_count() or 1)
+        if max_workers <= 1 or len(df) < _PARALLEL_MIN_ROWS:
+            column_stats = [_series_stats(df[col]) for col in present_columns]
+        else:
+            # Numba compiles on first call; do it here rather than in every worker
+            _stats_kernel()(np.empty(0, dtype=np.float64))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                column_stats = list(
+                    executor.map(_series_stats, (df[col] for col in present_columns))
+                )
+
+        for col, (mean, std, min_value, max_value, null_rate) in zip(present_columns, column_stats):
             stats = {
-                "mean": df[col].mean(),
-                "std": df[col].std(),
-                "min": df[col].min(),
-                "max": df[col].max(),
-                "null_rate": df[col].isnull().mean()
+                "mean": mean,
+                "std": std,
+                "min": min_value,
+                "max": max_value,
+                "null_rate": null_rate
             }
 
-            if col in thresholds:
-                col_thresholds = thresholds[col]
-                violations = []
-
-                for stat_name, stat_value in stats.items():
-                    if f"{stat_name}_min" in col_thresholds:
-                        if stat_value < col_thresholds[f"{stat_name}_min"]:
-                            violations.append({
-                                "stat": stat_name,
-                                "value": stat_value,
-                                "threshold": col_thresholds[f"{stat_name}_min"],
-                                "type": "below_min"
-                            })
-
-                    if f"{stat_name}_max" in col_thresholds:
-                        if stat_value > col_thresholds[f"{stat_name}_max"]:
-                            violations.append({
-                                "stat": stat_name,
-                                "value": stat_value,
-                                "threshold": col_thresholds[f"{stat_name}_max"],
-                                "type": "above_max"
-                            })
-
-                if violations:
-                    validation_results["passed"] = False
-                    validation_results["violations"].append({
-                        "column": col,
-                        "violations": violations
+            col_bounds = bounds[col]
+            violations = []
+
+            for stat_name, stat_value in stats.items():
+                lower = col_bounds.get((stat_name, "min"))
+                if lower is not None and stat_value < lower:
+                    violations.append({
+                        "stat": stat_name,
+                        "value": stat_value,
+                        "threshold": lower,
+                        "type": "below_min"
                     })
 
+                upper = col_bounds.get((stat_name, "max"))
+                if upper is not None and stat_value > upper:
+                    violations.append({
+                        "stat": stat_name,
+                        "value": stat_value,
+                        "threshold": upper,
+                        "type": "above_max"
+                    })
+
+            if violations:
+                validation_results["passed"] = False
+                validation_results["violations"].append({
+                    "column": col,
+                    "violations": violations
+                })
+
         return validation_results
 
     def validate_freshness(
@@ -222,6 +438,9 @@ def validate_freshness(
     ) -> Dict[str, Any]:
         """Validate data freshness based on timestamp column.
 
+        If the timestamp column is sorted in ascending order (e.g. append-only
+        logs), the last row is taken as the latest timestamp.
+
         Args:
             df: DataFrame to validate
             timestamp_column: Name of the timestamp column
@@ -231,7 +450,7 @@ def validate_freshness(
             Dictionary containing validation results
         """
         validation_results = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "validation_type": "freshness",
             "passed": True,
             "details": {}
@@ -242,12 +461,19 @@ def validate_freshness(
             validation_results["details"]["error"] = f"Timestamp column '{timestamp_column}' not found"
             return validation_results
 
-        # Convert to datetime (create a copy to avoid mutating input)
-        df_copy = df.copy()
-        df_copy[timestamp_column] = pd.to_datetime(df_copy[timestamp_column])
+        # Convert only the timestamp column; the input frame is left untouched
+        timestamps = pd.to_datetime(df[timestamp_column], utc=False, errors="coerce")
 
-        # Get latest timestamp
-        latest_timestamp = df_copy[timestamp_column].max()
+        # Get latest timestamp; append-only data is already sorted, so the
+        # last row is the maximum and the full reduction can be skipped
+        if not timestamps.empty and timestamps.is_monotonic_increasing:
+            latest_timestamp = timestamps.iloc[-1]
+        else:
+            latest_timestamp = timestamps.max()
+        if pd.isna(latest_timestamp):
+            validation_results["passed"] = False
+            validation_results["details"]["error"] = f"Timestamp column '{timestamp_column}' has no valid timestamps"
+            return validation_results
 
         # Handle timezone-aware and timezone-naive timestamps
         if latest_timestamp.tz is not None:
@@ -274,7 +500,7 @@ def validate_freshness(
     def create_expectation_suite(
         self,
         suite_name: str,
-        expectations: List[ExpectationConfiguration]
+        expectations: List["ExpectationConfiguration"]
     ) -> None:
         """Create or update an expectation suite."""
         suite = self.context.create_expectation_suite(
@@ -286,6 +512,7 @@ def create_expectation_suite(
             suite.add_expectation(expectation_configuration=expectation)
 
         self.context.save_expectation_suite(suite)
+        self._suite_cache[suite_name] = suite
         logger.info(f"Created expectation suite: {suite_name}")
 
     def generate_validation_report(
@@ -299,31 +526,62 @@ def generate_validation_report(
             validation_results: List of validation result dictionaries
             output_path: Path where to save the report
         """
-        report = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "total_validations": len(validation_results),
-            "passed": sum(1 for r in validation_results if r.get("passed", False)),
-            "failed": sum(1 for r in validation_results if not r.get("passed", False)),
-            "results": validation_results
+        total = 0
+        passed = 0
+        for result in validation_results:
+            total += 1
+            passed += bool(result.get("passed", False))
+
+        header = {
+            "timestamp": _now_iso(),
+            "total_validations": total,
+            "passed": passed,
+            "failed": total - passed
         }
 
+        # Write results one at a time so the serialized report is never held
+        # in memory as a whole
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, default=str)
+            f.write("{\n")
+            for key, value in header.items():
+                f.write(f'  "{key}": {_dumps_json(value)},\n')
+            f.write('  "results": [')
+            for i, result in enumerate(validation_results):
+                f.write(",\n" if i else "\n")
+                f.write(textwrap.indent(_dumps_json(result), "    "))
+            f.write("\n  ]\n}\n" if total else "]\n}\n")
 
         logger.info(f"Validation report saved to {output_path}")
 
-    def _dtype_compatible(self, actual: str, expected: str) -> bool:
+    def _to_arrow_strings(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return df with string columns converted to string[pyarrow].
+
+        Only StringDtype columns and object columns whose values are all
+        strings are converted; every other column is left unchanged.
+        """
+        string_columns = [
+            col for col, dtype in df.dtypes.items()
+            if isinstance(dtype, pd.StringDtype)
+            or (
+                pd.api.types.is_object_dtype(dtype)
+                and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+            )
+        ]
+        if not string_columns:
+            return df
+
+        converted = df.copy(deep=False)
+        for col in string_columns:
+            converted[col] = df[col].astype("string[pyarrow]")
+        return converted
+
+    def _dtype_compatible(self, actual: Any, expected: str) -> bool:
         """Check if actual dtype is compatible with expected dtype."""
-        dtype_mappings = {
-            "int": ["int8", "int16", "int32", "int64", "Int8", "Int16", "Int32", "Int64"],
-            "float": ["float16", "float32", "float64", "Float32", "Float64"],
-            "string": ["object", "string", "category"],
-            "datetime": ["datetime64", "datetime64[ns]", "datetime64[ns, UTC]"],
-            "bool": ["bool", "boolean"]
-        }
+        if expected == "string":
+            return _is_string_dtype(actual)
 
-        for dtype_family, dtypes in dtype_mappings.items():
-            if expected == dtype_family:
-                return any(dtype in actual for dtype in dtypes)
+        family_kinds = _DTYPE_FAMILY_KINDS.get(expected)
+        if family_kinds is None:
+            return str(actual) == expected
 
-        return actual == expected
\ No newline at end of file
+        return actual.kind in family_kinds
\ No newline at end of file
@@ -0,0 +1,400 @@
+"""Unit tests for data_quality.validators."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_quality.validators import DataValidator
+from data_quality.validators.base_validator import _series_stats
+
+
+@pytest.fixture
+def validator(mocker):
+    mocker.patch("great_expectations.get_context")
+    return DataValidator()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1.5, np.nan, -2.0, 4.25, np.nan, 10.0]),
+        pd.Series([3, None, 7, -1, 12], dtype="Int64"),
+        pd.Series([1, 5, 2, 8], dtype="int64"),
+        pd.Series([True, False, True, True]),
+        pd.Series([], dtype="float64"),
+        pd.Series([np.nan, np.nan, np.nan]),
+        pd.Series([42.0]),
+    ],
+    ids=["float_nan", "nullable_int", "int", "bool", "empty", "all_nan", "single"],
+)
+def test_series_stats_matches_pandas(series):
+    mean, std, min_value, max_value, null_rate = _series_stats(series)
+
+    assert mean == pytest.approx(series.mean(), nan_ok=True)
+    assert std == pytest.approx(series.std(ddof=1), nan_ok=True)
+    assert null_rate == pytest.approx(series.isnull().mean(), nan_ok=True)
+    if series.notna().any():
+        assert min_value == series.min()
+        assert max_value == series.max()
+    else:
+        assert np.isnan(min_value)
+        assert np.isnan(max_value)
+
+
+@pytest.mark.unit
+def test_series_stats_int_extremes_are_exact():
+    series = pd.Series([1, 2**53 + 3], dtype="Int64")
+
+    _, _, min_value, max_value, _ = _series_stats(series)
+
+    assert min_value == 1
+    assert max_value == 2**53 + 3
+
+
+@pytest.mark.unit
+def test_validate_statistical_properties_reports_violations(validator):
+    df = pd.DataFrame({
+        "amount": [1.0, 2.0, np.nan, 4.0],
+        "count": pd.Series([1, 2, 3, 4], dtype="Int64"),
+    })
+
+    result = validator.validate_statistical_properties(
+        df,
+        numeric_columns=["amount", "count", "missing"],
+        thresholds={
+            "amount": {"null_rate_max": 0.1, "max_max": 5.0},
+            "count": {"min_min": 0, "mean_max": 3.0},
+        },
+    )
+
+    assert result["passed"] is False
+    assert result["violations"] == [{
+        "column": "amount",
+        "violations": [{
+            "stat": "null_rate",
+            "value": 0.25,
+            "threshold": 0.1,
+            "type": "above_max",
+        }],
+    }]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series(pd.to_datetime(["2024-01-01", "2024-01-02"])),
+        pd.Series([Decimal("1.5"), Decimal("2.5")], dtype=object),
+    ],
+    ids=["datetime", "decimal"],
+)
+def test_validate_statistical_properties_rejects_non_numeric_columns(validator, values):
+    df = pd.DataFrame({"col": values})
+
+    with pytest.raises(TypeError, match="non-numeric dtype"):
+        validator.validate_statistical_properties(df, ["col"], {"col": {"max_max": 1.0}})
+
+
+@pytest.mark.unit
+def test_generate_validation_report_empty_is_valid_json(validator, tmp_path):
+    output_path = tmp_path / "report.json"
+
+    validator.generate_validation_report([], str(output_path))
+
+    with open(output_path, encoding="utf-8") as f:
+        text = f.read()
+    report = json.loads(text)
+    assert text == json.dumps(report, indent=2) + "\n"
+    assert report["total_validations"] == 0
+    assert report["passed"] == 0
+    assert report["failed"] == 0
+    assert report["results"] == []
+
+
+@pytest.mark.unit
+def test_generate_validation_report_round_trips_results(validator, tmp_path):
+    output_path = tmp_path / "report.json"
+    results = [
+        {"passed": np.bool_(True), "value": np.float64(1.5), "count": np.int64(3)},
+        {"passed": False, "value": np.nan, "details": {"columns": ["a", "b"]}},
+        {"validation_type": "schema"},
+    ]
+
+    validator.generate_validation_report(results, str(output_path))
+
+    with open(output_path, encoding="utf-8") as f:
+        text = f.read()
+    report = json.loads(text)
+    assert text == json.dumps(report, indent=2) + "\n"
+    assert report["total_validations"] == 3
+    assert report["passed"] == 1
+    assert report["failed"] == 2
+    assert report["results"] == [
+        {"passed": True, "value": 1.5, "count": 3},
+        {"passed": False, "value": None, "details": {"columns": ["a", "b"]}},
+        {"validation_type": "schema"},
+    ]
+
+
+@pytest.mark.unit
+def test_generate_validation_report_handles_integers_beyond_64_bits(validator, tmp_path):
+    output_path = tmp_path / "report.json"
+    results = [
+        {"passed": True, "count": 2**70, "value": np.float64(np.nan), "ratio": np.float32(0.5)},
+        {"passed": False},
+    ]
+
+    validator.generate_validation_report(results, str(output_path))
+
+    with open(output_path, encoding="utf-8") as f:
+        text = f.read()
+    report = json.loads(text)
+    assert text == json.dumps(report, indent=2) + "\n"
+    assert report["results"] == [
+        {"passed": True, "count": 2**70, "value": None, "ratio": 0.5},
+        {"passed": False},
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expected_columns",
+    [["id", "name", "created_at"], frozenset({"id", "name", "created_at"})],
+)
+def test_validate_schema_reports_missing_and_unexpected_columns(validator, expected_columns):
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"], "extra": [0.1, 0.2]})
+
+    result = validator.validate_schema(df, expected_columns, {"id": "int", "name": "string"})
+
+    assert result["passed"] is False
+    assert result["errors"] == [
+        {"type": "missing_columns", "columns": ["created_at"]},
+        {"type": "unexpected_columns", "columns": ["extra"]},
+    ]
+
+
+@pytest.mark.unit
+def test_validate_schema_reports_missing_columns_in_expected_order(validator):
+    df = pd.DataFrame({"id": [1, 2], "extra": [0.1, 0.2]})
+
+    result = validator.validate_schema(df, ["id", "b", "a", "c", "b"], {})
+
+    assert result["errors"] == [
+        {"type": "missing_columns", "columns": ["b", "a", "c"]},
+        {"type": "unexpected_columns", "columns": ["extra"]},
+    ]
+
+
+@pytest.mark.unit
+def test_validate_schema_empty_dataframe_fails(validator):
+    result = validator.validate_schema(pd.DataFrame(), ["id"], {})
+
+    assert result["passed"] is False
+    assert result["errors"][0]["type"] == "empty_dataframe"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("dtype", "expected", "compatible"),
+    [
+        ("int32", "int", True),
+        ("UInt8", "int", True),
+        ("Int64", "float", False),
+        ("Float64", "float", True),
+        ("datetime64[ns, UTC]", "datetime", True),
+        ("boolean", "bool", True),
+        ("object", "string", True),
+        ("string", "string", True),
+        ("string[pyarrow]", "string", True),
+        ("large_string[pyarrow]", "string", True),
+        ("category", "string", True),
+        ("period[D]", "string", False),
+        ("interval[int64]", "string", False),
+        ("Int64", "string", False),
+        ("int64", "int64", True),
+        ("int32", "int64", False),
+    ],
+)
+def test_dtype_compatible(validator, dtype, expected, compatible):
+    actual = pd.api.types.pandas_dtype(dtype)
+
+    assert validator._dtype_compatible(actual, expected) is compatible
+
+
+@pytest.mark.unit
+def test_dtype_compatible_arrow_nested_types_are_not_strings(validator):
+    pa = pytest.importorskip("pyarrow")
+
+    assert not validator._dtype_compatible(pd.ArrowDtype(pa.list_(pa.int64())), "string")
+    assert not validator._dtype_compatible(pd.ArrowDtype(pa.struct([("a", pa.int64())])), "string")
+    assert validator._dtype_compatible(
+        pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string())), "string"
+    )
+
+
+@pytest.mark.unit
+def test_to_arrow_strings_converts_only_string_columns(validator):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "name": ["a", None, "c"],
+        "code": pd.array(["x", "y", "z"], dtype="string"),
+        "ints": pd.Series([1, 2, 3], dtype=object),
+        "when": pd.Series([pd.Timestamp("2024-01-01"), None, None], dtype=object),
+        "value": [1.0, 2.0, 3.0],
+    })
+
+    converted = validator._to_arrow_strings(df)
+
+    assert converted["name"].dtype == "string[pyarrow]"
+    assert converted["code"].dtype == "string[pyarrow]"
+    assert converted["ints"].dtype == object
+    assert converted["when"].dtype == object
+    assert converted["value"].dtype == np.float64
+    assert df["name"].dtype == object
+
+
+@pytest.mark.unit
+def test_validate_data_quality_arrow_strings_requires_pyarrow(validator, mocker):
+    mocker.patch("importlib.util.find_spec", return_value=None)
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        validator.validate_data_quality(pd.DataFrame({"a": ["x"]}), "suite", arrow_strings=True)
+
+
+@pytest.mark.unit
+def test_validate_data_quality_loads_suite_once(validator):
+    context = validator.context
+    validator_mock = context.get_validator.return_value
+    validator_mock.validate.return_value = {
+        "success": False,
+        "statistics": {"evaluated_expectations": 1},
+        "results": [{
+            "success": False,
+            "expectation_config": {
+                "expectation_type": "expect_column_values_to_not_be_null",
+                "kwargs": {"column": "a"},
+            },
+            "result": {"unexpected_count": 1},
+        }],
+    }
+    df = pd.DataFrame({"a": [1, None]})
+
+    validator.validate_data_quality(df, "orders")
+    passed, summary = validator.validate_data_quality(df, "orders")
+
+    context.get_expectation_suite.assert_called_once_with(expectation_suite_name="orders")
+    assert context.get_validator.call_args.kwargs["expectation_suite"] is (
+        context.get_expectation_suite.return_value
+    )
+    assert passed is False
+    assert summary["failed_expectations"] == [{
+        "expectation": "expect_column_values_to_not_be_null",
+        "kwargs": {"column": "a"},
+        "result": {"unexpected_count": 1},
+    }]
+
+
+@pytest.mark.unit
+def test_validate_data_quality_reports_errors(validator):
+    validator.context.get_validator.side_effect = RuntimeError("boom")
+
+    passed, summary = validator.validate_data_quality(pd.DataFrame({"a": [1]}), "orders")
+
+    assert passed is False
+    assert summary == {"error": "boom"}
+
+
+@pytest.mark.unit
+def test_create_expectation_suite_adds_each_expectation(validator, mocker):
+    context = validator.context
+    suite = context.create_expectation_suite.return_value
+    expectations = [object(), object()]
+
+    validator.create_expectation_suite("orders", expectations)
+    validator.validate_data_quality(pd.DataFrame({"a": [1]}), "orders")
+
+    assert suite.add_expectation.call_args_list == [
+        mocker.call(expectation_configuration=expectation) for expectation in expectations
+    ]
+    context.save_expectation_suite.assert_called_once_with(suite)
+    context.get_expectation_suite.assert_not_called()
+
+
+@pytest.mark.unit
+def test_init_creates_context_eagerly(mocker):
+    get_context = mocker.patch(
+        "great_expectations.get_context", side_effect=RuntimeError("bad context")
+    )
+
+    with pytest.raises(RuntimeError, match="bad context"):
+        DataValidator(context_root_dir="/nonexistent")
+    get_context.assert_called_once_with(context_root_dir="/nonexistent")
+
+
+@pytest.mark.unit
+def test_validate_freshness_missing_column(validator):
+    result = validator.validate_freshness(pd.DataFrame({"a": [1]}), "updated_at")
+
+    assert result["passed"] is False
+    assert "not found" in result["details"]["error"]
+
+
+@pytest.mark.unit
+def test_validate_freshness_without_valid_timestamps_fails(validator):
+    df = pd.DataFrame({"updated_at": ["not a date", None]})
+
+    result = validator.validate_freshness(df, "updated_at")
+
+    assert result["passed"] is False
+    assert "no valid timestamps" in result["details"]["error"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("ascending", [True, False])
+def test_validate_freshness_uses_latest_timestamp(validator, ascending):
+    now = pd.Timestamp.now(tz="UTC")
+    timestamps = [now - pd.Timedelta(hours=h) for h in (48, 30, 1)]
+    if not ascending:
+        timestamps.reverse()
+    df = pd.DataFrame({"updated_at": timestamps, "value": [1, 2, 3]})
+
+    result = validator.validate_freshness(df, "updated_at", max_staleness_hours=24)
+
+    assert result["passed"] is True
+    assert result["details"]["latest_timestamp"] == timestamps[-1 if ascending else 0].isoformat()
+    assert df["updated_at"].dtype == "datetime64[ns, UTC]"
+
+
+@pytest.mark.unit
+def test_validate_freshness_stale_naive_timestamps(validator):
+    df = pd.DataFrame({"updated_at": ["2020-01-01", "2020-01-02"]})
+
+    result = validator.validate_freshness(df, "updated_at", max_staleness_hours=24)
+
+    assert result["passed"] is False
+    assert result["details"]["latest_timestamp"] == "2020-01-02T00:00:00"
+    assert df["updated_at"].dtype == object
+
+
+@pytest.mark.unit
+def test_validate_statistical_properties_parallel_matches_serial(validator, mocker):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(1_000, 4)), columns=["a", "b", "c", "d"])
+    thresholds = {col: {"mean_max": -1.0, "std_min": 2.0} for col in df.columns}
+
+    serial = validator.validate_statistical_properties(df, list(df.columns), thresholds)
+    mocker.patch("data_quality.validators.base_validator._PARALLEL_MIN_ROWS", 0)
+    mocker.patch("data_quality.validators.base_validator.os.cpu_count", return_value=4)
+    pool = mocker.patch(
+        "data_quality.validators.base_validator.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    )
+    parallel = validator.validate_statistical_properties(df, list(df.columns), thresholds)
+
+    pool.assert_called_once_with(max_workers=4)
+    assert parallel["violations"] == serial["violations"]
+    assert [v["column"] for v in parallel["violations"]] == ["a", "b", "c", "d"]